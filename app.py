@@ -235,6 +235,79 @@ def new_video_case():
                 return redirect(request.url)
 
     return render_template("new_video_case.html")
+
+# -----------------------------------
+# MULTI-ANGLE SCENE ROUTE
+# -----------------------------------
+
+MAX_SCENE_IMAGES = 10
+ALLOWED_IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.webp', '.bmp', '.gif', '.tif', '.tiff'}
+
+def allowed_image(filename):
+    return os.path.splitext(filename.lower())[1] in ALLOWED_IMAGE_EXTENSIONS
+
+@app.route("/new-scene", methods=["GET", "POST"])
+def new_scene_case():
+    if "user" not in session:
+        return redirect(url_for("login"))
+
+    if request.method == "POST":
+        files = [f for f in request.files.getlist('images') if f.filename != '']
+        if not files:
+            flash("No selected files", "error")
+            return redirect(request.url)
+
+        if len(files) > MAX_SCENE_IMAGES:
+            flash(f"A scene case accepts at most {MAX_SCENE_IMAGES} photos.", "error")
+            return redirect(request.url)
+
+        if not all(allowed_image(f.filename) for f in files):
+            flash("Invalid image file in selection", "error")
+            return redirect(request.url)
+
+        filenames = []
+        filepaths = []
+        try:
+            # 1. Save every angle
+            for file in files:
+                filename = secure_filename(f"{uuid.uuid4().hex[:8]}_{file.filename}")
+                filepath = os.path.join(UPLOAD_DIR, filename)
+                file.save(filepath)
+                filenames.append(filename)
+                filepaths.append(filepath)
+
+            # 2. Run one Gemini call over all angles
+            print(f"🕵️ Analyzing scene with {len(filepaths)} angles with Gemini...")
+            analysis_result = ai_engine.analyze_scene(filepaths)
+
+            # 3. Save to MongoDB
+            case_id = uuid.uuid4().hex[:8]
+            case_data = {
+                "case_id": case_id,
+                "user": session["user"],
+                "type": "scene",  # Marking this as a multi-angle case
+                "filename": filenames[0],  # Cover image for single-file views
+                "filenames": filenames,
+                "analysis": analysis_result
+            }
+            db.save_case(case_data)
+
+            flash("Scene forensic analysis complete.", "success")
+            return redirect(url_for("view_case", case_id=case_id))
+
+        except Exception as e:
+            print(f"Scene Analysis Failed: {e}")
+            # Don't leave orphaned angles behind when no case was saved
+            for filepath in filepaths:
+                try:
+                    os.remove(filepath)
+                except OSError as err:
+                    print(f"Error deleting file: {err}")
+            flash(f"AI Analysis Failed: {str(e)}", "error")
+            return redirect(request.url)
+
+    return render_template("new_scene_case.html")
+
 @app.route("/delete/<case_id>", methods=["POST"])
 def delete_case(case_id):
     if "user" not in session:
@@ -244,13 +317,14 @@ def delete_case(case_id):
     case_data = db.get_case(case_id, session["user"])
     
     if case_data:
-        # 2. Delete the physical file from the uploads folder
-        file_path = os.path.join(UPLOAD_DIR, case_data.get("filename", ""))
-        if os.path.exists(file_path):
-            try:
-                os.remove(file_path)
-            except OSError as e:
-                print(f"Error deleting file: {e}")
+        # 2. Delete the physical file(s) from the uploads folder
+        for filename in case_data.get("filenames") or [case_data.get("filename", "")]:
+            file_path = os.path.join(UPLOAD_DIR, filename)
+            if filename and os.path.exists(file_path):
+                try:
+                    os.remove(file_path)
+                except OSError as e:
+                    print(f"Error deleting file: {e}")
                 
         # 3. Delete the record from MongoDB
         db.cases.delete_one({"case_id": case_id, "user": session["user"]})
@@ -40,4 +40,24 @@ class MongoDB:
         return self.cases.find_one({"case_id": case_id, "user": user})
 
     def delete_case(self, case_id, user):
-        self.cases.delete_one({"case_id": case_id, "user": user})
\ No newline at end of file
+        self.cases.delete_one({"case_id": case_id, "user": user})
+
+    # ---------- REPROCESSING ----------
+    def get_cases_page(self, query, after_id=None, limit=100):
+        """Returns the next page of matching cases oldest-first, starting after `after_id`."""
+        if after_id is not None:
+            query = {**query, "_id": {"$gt": after_id}}
+        return list(self.cases.find(query).sort("_id", 1).limit(limit))
+
+    def count_cases(self, query):
+        return self.cases.count_documents(query)
+
+    def save_analysis_version(self, case_id, version, result, model_id):
+        self.cases.update_one(
+            {"case_id": case_id},
+            {"$set": {f"analyses.{version}": {
+                "model_id": model_id,
+                "analyzed_at": datetime.utcnow(),
+                "result": result
+            }}}
+        )
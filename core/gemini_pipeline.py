@@ -2,7 +2,7 @@ import os
 import json
 from google import genai
 from google.genai import types
-from PIL import Image
+from PIL import Image, ImageOps
 from core.video_utils import extract_keyframes
 
 class GeminiForensicPipeline:
@@ -26,6 +26,18 @@ class GeminiForensicPipeline:
             )
         ]
 
+    def _prepare_image(self, image_path: str, max_side: int = 1536) -> Image.Image:
+        """Opens an image, fixes its EXIF rotation and downscales it for upload."""
+        try:
+            img = Image.open(image_path)
+            img = ImageOps.exif_transpose(img).convert("RGB")
+        except Exception as e:
+            raise FileNotFoundError(f"Could not open image: {e}")
+
+        # Phone photos are often 12MP+; Gemini does not need that many pixels
+        img.thumbnail((max_side, max_side))
+        return img
+
     def _parse_response(self, response) -> dict:
         """Safely extracts JSON, handling safety blocks and markdown formatting."""
         try:
@@ -157,4 +169,57 @@ class GeminiForensicPipeline:
         
         result_dict = self._parse_response(response)
         result_dict["video_meta"] = {"fps": round(fps, 1), "frames_analyzed": len(frames)}
-        return result_dict
\ No newline at end of file
+        return result_dict
+
+    def analyze_scene(self, image_paths: list) -> dict:
+        """Analyzes several photos of the same accident scene in a single request."""
+        if not image_paths:
+            raise ValueError("A scene case needs at least one image.")
+
+        print(f"🖼️ Preparing {len(image_paths)} scene angles...")
+        images = [self._prepare_image(path) for path in image_paths]
+
+        prompt = f"""
+        You are an expert digital forensic investigator analyzing a traffic accident scene.
+        I have provided {len(images)} photos of the SAME accident, taken from different angles. Each photo is preceded by its label, "Photo 1" to "Photo {len(images)}".
+        Cross-reference all angles to build ONE consistent reconstruction and output a strict JSON object with this exact schema:
+        {{
+            "scene_summary": "A detailed 2-sentence caption of the whole accident scene.",
+            "collision_type": "Head-on, Rear-end, Side-impact, Rollover, or N/A",
+            "severity_score": <integer from 0 to 100>,
+            "pedestrians_detected": <boolean>,
+            "license_plates_detected": ["List", "of", "plates", "if", "visible", "otherwise empty"],
+            "vehicles_involved": [
+                {{
+                    "type": "car/truck/motorcycle/bus/etc",
+                    "fault_percentage": <integer from 0 to 100>,
+                    "reasoning": "Investigative reasoning for this fault assignment, citing the photo numbers that support it."
+                }}
+            ],
+            "investigative_narrative": "A professional, 2-paragraph forensic reconstruction of the event.",
+            "angles": [
+                {{
+                    "photo_index": <integer photo number, starting at 1>,
+                    "observation": "What this particular angle reveals about the collision."
+                }}
+            ]
+        }}
+        """
+
+        print(f"⏳ Sending {len(images)} scene angles to Gemini API...")
+        # Label every image so the model's photo_index matches the gallery's "Angle N"
+        contents = [part for i, img in enumerate(images, start=1) for part in (f"Photo {i}:", img)] + [prompt]
+
+        response = self.client.models.generate_content(
+            model=self.model_id,
+            contents=contents,
+            config=types.GenerateContentConfig(
+                response_mime_type="application/json",
+                temperature=0.2,
+                safety_settings=self.safety
+            ),
+        )
+
+        result_dict = self._parse_response(response)
+        result_dict["scene_meta"] = {"images_analyzed": len(images)}
+        return result_dict
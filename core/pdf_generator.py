@@ -1,5 +1,6 @@
 import os
 import cv2
+from PIL import Image, ImageOps
 from reportlab.lib.pagesizes import letter
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Image as RLImage, Table, TableStyle
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
@@ -32,8 +33,40 @@ def generate_case_pdf(case_data, upload_dir, report_dir):
     # 2. Evidence Image / Video Thumbnail
     file_path = os.path.join(upload_dir, case_data["filename"])
     thumb_path = None
+    angle_thumbs = []
 
-    if os.path.exists(file_path):
+    if case_type == "scene":
+        # Lay the angles out two per row so a 10-photo scene stays compact
+        cells = []
+        for idx, filename in enumerate(case_data.get("filenames", [case_data["filename"]]), start=1):
+            angle_path = os.path.join(upload_dir, filename)
+            if not os.path.exists(angle_path):
+                continue
+            # Upright, downscaled copy so portrait shots render correctly and the PDF stays small
+            angle_thumb = os.path.join(report_dir, f"temp_angle_{case_id}_{idx}.jpg")
+            try:
+                with Image.open(angle_path) as photo:
+                    photo = ImageOps.exif_transpose(photo).convert("RGB")
+                    photo.thumbnail((800, 800))
+                    photo.save(angle_thumb, "JPEG", quality=85)
+            except Exception as e:
+                print(f"Could not render angle {idx}: {e}")
+                continue
+            angle_thumbs.append(angle_thumb)
+            cells.append([
+                RLImage(angle_thumb, width=220, height=160, kind='proportional'),
+                Paragraph(f"<i>Angle {idx}</i>", sub_style)
+            ])
+
+        if cells:
+            elements.append(Paragraph("Primary Scene Evidence", section_style))
+            rows = [cells[i:i + 2] for i in range(0, len(cells), 2)]
+            if len(rows[-1]) == 1:
+                rows[-1].append("")
+            elements.append(Table(rows, colWidths=[230, 230]))
+            elements.append(Spacer(1, 15))
+
+    elif os.path.exists(file_path):
         elements.append(Paragraph("Primary Scene Evidence", section_style))
         
         if case_type == "video":
@@ -68,6 +101,10 @@ def generate_case_pdf(case_data, upload_dir, report_dir):
         telemetry_data.append(["Frames Analyzed", str(ai_data["video_meta"].get("frames_analyzed", "N/A"))])
         telemetry_data.append(["Source FPS", str(ai_data["video_meta"].get("fps", "N/A"))])
 
+    # Add scene metadata if present
+    if case_type == "scene" and "scene_meta" in ai_data:
+        telemetry_data.append(["Angles Analyzed", str(ai_data["scene_meta"].get("images_analyzed", "N/A"))])
+
     t_table = Table(telemetry_data, colWidths=[150, 300])
     t_table.setStyle(TableStyle([
         ('BACKGROUND', (0,0), (0,-1), colors.HexColor("#f0f4f8")),
@@ -101,6 +138,28 @@ def generate_case_pdf(case_data, upload_dir, report_dir):
         ]))
         elements.append(time_table)
 
+    # 4b. Per-Angle Observations (Only added if it's a scene case)
+    if case_type == "scene" and "angles" in ai_data:
+        elements.append(Paragraph("Per-Angle Observations", section_style))
+        angle_data = [["Angle", "Observation"]]
+        for angle in ai_data["angles"]:
+            angle_data.append([
+                f"#{angle.get('photo_index', '?')}",
+                Paragraph(angle.get('observation', ''), body_style)
+            ])
+
+        angle_table = Table(angle_data, colWidths=[80, 380])
+        angle_table.setStyle(TableStyle([
+            ('BACKGROUND', (0,0), (-1,0), colors.HexColor("#f59e0b")), # Amber header for scenes
+            ('TEXTCOLOR', (0,0), (-1,0), colors.whitesmoke),
+            ('ALIGN', (0,0), (-1,-1), 'LEFT'),
+            ('FONTNAME', (0,0), (-1,0), 'Helvetica-Bold'),
+            ('BOTTOMPADDING', (0,0), (-1,-1), 8),
+            ('GRID', (0,0), (-1,-1), 1, colors.HexColor("#cbd5e1")),
+            ('VALIGN', (0,0), (-1,-1), 'TOP'),
+        ]))
+        elements.append(angle_table)
+
     # 5. Fault Allocation Table
     elements.append(Paragraph("Fault Allocation", section_style))
     fault_data = [["Vehicle Type", "Fault %", "AI Reasoning"]]
@@ -131,11 +190,12 @@ def generate_case_pdf(case_data, upload_dir, report_dir):
     # Generate the PDF
     doc.build(elements)
     
-    # Cleanup: Delete the temporary video thumbnail so it doesn't take up space
-    if thumb_path and os.path.exists(thumb_path):
-        try:
-            os.remove(thumb_path)
-        except Exception as e:
-            print(f"Could not delete temp thumb: {e}")
+    # Cleanup: Delete the temporary thumbnails so they don't take up space
+    for temp_path in [thumb_path] + angle_thumbs:
+        if temp_path and os.path.exists(temp_path):
+            try:
+                os.remove(temp_path)
+            except Exception as e:
+                print(f"Could not delete temp thumb: {e}")
 
     return pdf_path
\ No newline at end of file
@@ -0,0 +1,202 @@
+"""
+Bulk re-analysis of stored cases.
+
+Streams cases from MongoDB, re-runs them through the Gemini pipeline with a
+bounded number of requests in flight and stores each result under
+`analyses.<version>` next to the original `analysis`. A case that already has
+the requested version is skipped, so re-running the same command after a crash
+resumes where the previous run stopped.
+
+Example:
+    python reprocess.py --analysis-version v2_prompt --type image --since 2026-01-01 --workers 8
+"""
+import os
+import re
+import time
+import argparse
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from dotenv import load_dotenv
+from google.genai import errors
+from core.db import MongoDB
+from core.gemini_pipeline import GeminiForensicPipeline
+
+VERSION_PATTERN = re.compile(r"^[A-Za-z0-9_-]+$")
+RETRYABLE_CODES = {429, 500, 502, 503, 504}
+MAX_ATTEMPTS = 4
+
+
+def parse_date(value):
+    try:
+        return datetime.strptime(value, "%Y-%m-%d")
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid date '{value}', expected YYYY-MM-DD")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Re-run Gemini analysis over stored cases.")
+    parser.add_argument("--analysis-version", required=True,
+                        help="Key the new results are stored under (letters, digits, '_' and '-').")
+    parser.add_argument("--model", help="Override the pipeline's model_id for this run.")
+    parser.add_argument("--type", choices=["image", "video", "scene"], help="Only reprocess this case type.")
+    parser.add_argument("--user", help="Only reprocess cases owned by this investigator.")
+    parser.add_argument("--since", type=parse_date, help="Only cases created on or after this date (YYYY-MM-DD).")
+    parser.add_argument("--until", type=parse_date, help="Only cases created before this date (YYYY-MM-DD).")
+    parser.add_argument("--workers", type=int, default=4, help="Concurrent Gemini requests (default: 4).")
+    parser.add_argument("--limit", type=int, default=0, help="Stop after this many cases (default: no limit).")
+    parser.add_argument("--dry-run", action="store_true", help="Only count the cases that would be reprocessed.")
+    args = parser.parse_args()
+
+    if not VERSION_PATTERN.match(args.analysis_version):
+        parser.error("--analysis-version may only contain letters, digits, '_' and '-'.")
+    if args.workers < 1:
+        parser.error("--workers must be at least 1.")
+    return args
+
+
+def build_query(args):
+    # Cases already carrying this version are done; skipping them is what makes runs resumable
+    query = {f"analyses.{args.analysis_version}": {"$exists": False}}
+    if args.type == "image":
+        # Early cases were saved before "type" existed and default to image everywhere else
+        query["type"] = {"$in": ["image", None]}
+    elif args.type:
+        query["type"] = args.type
+    if args.user:
+        query["user"] = args.user
+
+    created = {}
+    if args.since:
+        created["$gte"] = args.since
+    if args.until:
+        created["$lt"] = args.until
+    if created:
+        query["created_at"] = created
+    return query
+
+
+def reanalyze(engine, case, upload_dir):
+    """Runs the pipeline method matching the case type and returns the new analysis."""
+    case_type = case.get("type", "image")
+    if case_type == "scene":
+        paths = [os.path.join(upload_dir, f) for f in case.get("filenames", [case["filename"]])]
+    else:
+        paths = [os.path.join(upload_dir, case["filename"])]
+
+    missing = [p for p in paths if not os.path.exists(p)]
+    if missing:
+        raise FileNotFoundError(f"Evidence missing on disk: {', '.join(missing)}")
+
+    if case_type == "video":
+        return engine.analyze_video(paths[0])
+    if case_type == "scene":
+        return engine.analyze_scene(paths)
+    return engine.analyze_image(paths[0])
+
+
+def reanalyze_with_retry(engine, case, upload_dir):
+    """Retries rate-limit and overload errors with exponential backoff; anything else fails at once."""
+    for attempt in range(1, MAX_ATTEMPTS + 1):
+        try:
+            return reanalyze(engine, case, upload_dir)
+        except errors.APIError as e:
+            if e.code not in RETRYABLE_CODES or attempt == MAX_ATTEMPTS:
+                raise
+            delay = 2 ** attempt
+            print(f"⏳ {case['case_id']}: Gemini returned {e.code}, retrying in {delay}s ({attempt}/{MAX_ATTEMPTS - 1})...")
+            time.sleep(delay)
+
+
+def format_eta(seconds):
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h{minutes:02d}m{seconds:02d}s"
+
+
+def main():
+    load_dotenv()
+    args = parse_args()
+    upload_dir = os.getenv("UPLOAD_DIR", "/tmp/uploads")
+
+    db = MongoDB()
+    query = build_query(args)
+    total = db.count_cases(query)
+    if args.limit:
+        total = min(total, args.limit)
+
+    print(f"📂 {total} case(s) pending for analysis version '{args.analysis_version}'.")
+    if args.dry_run or total == 0:
+        return
+
+    engine = GeminiForensicPipeline()
+    if args.model:
+        engine.model_id = args.model
+    print(f"🤖 Reprocessing with {engine.model_id} using {args.workers} worker(s)...")
+
+    done = failed = 0
+    started = time.monotonic()
+
+    def collect(future, case_id):
+        nonlocal done, failed
+        try:
+            db.save_analysis_version(case_id, args.analysis_version, future.result(), engine.model_id)
+            done += 1
+            report(case_id)
+        except Exception as e:
+            failed += 1
+            report(case_id, e)
+
+    def report(case_id, error=None):
+        elapsed = time.monotonic() - started
+        rate = (done + failed) / elapsed if elapsed else 0
+        eta = format_eta((total - done - failed) / rate) if rate else "?"
+        status = f"❌ {case_id}: {error}" if error else f"✅ {case_id}"
+        print(f"[{done + failed}/{total}] {status} | {rate * 60:.1f} cases/min | ETA {eta}")
+
+    # Small pages re-queried by _id, so slow Gemini calls never hold a server cursor open
+    page_size = args.workers * 2
+    submitted = 0
+    last_id = None
+
+    pool = ThreadPoolExecutor(max_workers=args.workers)
+    pending = {}
+    interrupted = False
+    try:
+        while not (args.limit and submitted >= args.limit):
+            page = db.get_cases_page(query, after_id=last_id, limit=page_size)
+            if not page:
+                break
+
+            for case in page:
+                if args.limit and submitted >= args.limit:
+                    break
+
+                # Keep the number of queued cases bounded
+                while len(pending) >= page_size:
+                    finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        collect(future, pending.pop(future))
+
+                pending[pool.submit(reanalyze_with_retry, engine, case, upload_dir)] = case["case_id"]
+                submitted += 1
+                last_id = case["_id"]
+    except KeyboardInterrupt:
+        interrupted = True
+        print("⚠️ Interrupted: saving the analyses already in flight before exiting...")
+        pool.shutdown(wait=False, cancel_futures=True)
+    finally:
+        # Whatever stopped the loop, results Gemini already produced are still stored
+        for future in list(pending):
+            case_id = pending.pop(future)
+            if not future.cancelled():
+                collect(future, case_id)
+        pool.shutdown()
+
+    elapsed = time.monotonic() - started
+    print(f"🏁 Finished in {format_eta(elapsed)}: {done} reprocessed, {failed} failed.")
+    if failed or interrupted:
+        print("ℹ️ Re-run the same command to resume and retry the failed cases.")
+
+
+if __name__ == "__main__":
+    main()